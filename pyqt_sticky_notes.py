@@ -1,5 +1,6 @@
 import sys
 import json
+import functools
 import os
 from pathlib import Path
 from datetime import datetime
@@ -12,22 +13,22 @@ os.environ["QT_ENABLE_HIGHDPI_SCALING"] = "0"
 # PyQt6 imports
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                              QPushButton, QLineEdit, QListWidget, QListWidgetItem, QTextEdit,
-                             QMessageBox, QMenu, QSystemTrayIcon, QColorDialog, QSlider, QLabel, QFrame, QFontDialog)
+                             QPlainTextEdit, QMessageBox, QMenu, QSystemTrayIcon, QColorDialog,
+                             QSlider, QLabel, QFrame, QFontDialog)
 from PyQt6.QtGui import QIcon, QAction, QColor, QTextCharFormat, QFont, QGuiApplication, QPixmap, QPainter
-from PyQt6.QtCore import Qt, QSize, QEvent, pyqtSignal, QObject
-
-# PIL for icon and image handling
-from PIL import Image, ImageDraw, ImageGrab
-from PIL.ImageQt import ImageQt
-
-# Global hotkey support
-from pynput import keyboard
-from pynput.keyboard import Key, KeyCode
+from PyQt6.QtCore import Qt, QSize, QEvent, pyqtSignal, QObject, QTimer
 
 # Auto-copy support
 import pyautogui
 import platform
 
+# orjson is ~5-10x faster than the stdlib encoder and emits bytes directly;
+# fall back to stdlib json when it isn't installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 def resource_path(relative_path):
     """ Get absolute path to resource, works for dev and for PyInstaller """
     try:
@@ -38,6 +39,105 @@ def resource_path(relative_path):
     return os.path.join(base_path, relative_path)
 
 
+# Markers that indicate stored HTML actually carries formatting (Qt only
+# emits spans/inline tags when character formats differ from the default).
+_RICH_MARKERS = ("<span", "<img", "<b>", "<i>", "<u>")
+
+
+def _looks_rich(html):
+    """Heuristic for whether a note's stored HTML contains real formatting."""
+    return any(marker in html for marker in _RICH_MARKERS)
+
+
+def _dumps(obj, pretty=False):
+    """Serialize JSON for disk as bytes.
+
+    Compact separators on the hot path (pretty-printing costs CPU and
+    2-5x the bytes); indent only for the final write on quit so users who
+    hand-inspect the files still get readable output.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode()
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode()
+
+
+def _loads(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Static stylesheet skeleton for note windows. Built once; per-note styling
+# only substitutes the two color tokens instead of reassembling the whole
+# CSS string on every apply_styles call.
+_NOTE_STYLE_TEMPLATE = """
+    NoteWindow, QWidget { background-color: __BG__; }
+    QLineEdit { background-color: __BG__; }
+    QTextEdit, QPlainTextEdit { background-color: __BG__; border: none; }
+
+    /* Blended button style - no borders, transparent background */
+    QPushButton {
+        background-color: transparent;
+        border: none;
+        border-radius: 3px;
+        padding: 4px 8px;
+        color: #555;
+        font-size: 11px;
+    }
+    QPushButton:hover {
+        background-color: __HOVER__;
+    }
+    QPushButton:pressed {
+        background-color: rgba(0, 0, 0, 0.1);
+    }
+    QPushButton:checked {
+        background-color: rgba(0, 0, 0, 0.15);
+        font-weight: bold;
+    }
+
+    QSlider::groove:horizontal {
+        border: 1px solid #bbb;
+        background: white;
+        height: 5px;
+        border-radius: 2px;
+    }
+    QSlider::sub-page:horizontal {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #66e, stop:1 #bbf);
+        height: 10px;
+        border-radius: 2px;
+    }
+    QSlider::handle:horizontal {
+        background: #777;
+        border: 1px solid #5c5c5c;
+        width: 14px;
+        margin: -5px 0;
+        border-radius: 7px;
+    }
+    QFrame { background-color: __BG__; }
+    QLabel {
+        background-color: __BG__;
+        color: #888;
+        font-size: 10px;
+    }
+"""
+
+
+@functools.lru_cache(maxsize=64)
+def _style_for_color(color):
+    """Full note-window stylesheet for a color, memoized per unique hex.
+
+    Users tend to reuse a handful of colors, so repeat opens and bulk
+    color changes hit the cache and skip both the hover-color math and
+    the string substitution.
+    """
+    # Slightly darker shade of the background for button hover
+    r, g, b = tuple(int(color.lstrip('#')[i:i + 2], 16) for i in (0, 2, 4))
+    hover_color = f"#{max(0, r - 20):02x}{max(0, g - 20):02x}{max(0, b - 20):02x}"
+    return _NOTE_STYLE_TEMPLATE.replace("__BG__", color).replace("__HOVER__", hover_color)
+
+
 class HotkeySignaler(QObject):
     """Helper class to emit Qt signals from the hotkey thread"""
     create_note_signal = pyqtSignal(str)
@@ -59,8 +159,8 @@ class NoteWindow(QWidget):
         self.setWindowTitle(self.note_data.get("title", "Note"))
         self.setWindowIcon(self.app.app_icon)
         
-        # Restore position and size
-        positions = self.app.load_positions()
+        # Restore position and size from the app's in-memory cache
+        positions = self.app.positions
         if self.note_id in positions:
             pos = positions[self.note_id]
             self.setGeometry(pos['x'], pos['y'], pos['width'], pos['height'])
@@ -136,24 +236,57 @@ class NoteWindow(QWidget):
         formatting_layout.addStretch()
         self.main_layout.addLayout(formatting_layout)
 
-        # Text Editor
-        self.text_edit = QTextEdit()
-        self.text_edit.setHtml(self.note_data.get("content_html", ""))
+        # Text Editor — unformatted notes get a QPlainTextEdit, which skips
+        # the rich-text layout machinery entirely; the first use of the
+        # formatting toolbar upgrades the widget to a QTextEdit.
+        html = self.note_data.get("content_html", "")
+        self.is_rich = bool(self.note_data.get("is_rich", _looks_rich(html)))
+        if self.is_rich:
+            self.text_edit = QTextEdit()
+            # Bulk-load the document inside an edit block so the layout is
+            # built in one pass, and with signals blocked so the programmatic
+            # insert doesn't look like a user edit to anything connected later.
+            self.text_edit.blockSignals(True)
+            cursor = self.text_edit.textCursor()
+            cursor.beginEditBlock()
+            self.text_edit.setHtml(html)
+            cursor.endEditBlock()
+            self.text_edit.blockSignals(False)
+        else:
+            self.text_edit = QPlainTextEdit()
+            self.text_edit.blockSignals(True)
+            self.text_edit.setPlainText(self.note_data.get("content_text", ""))
+            self.text_edit.blockSignals(False)
         self.main_layout.addWidget(self.text_edit)
 
         # --- Initial State & Connections ---
+        # Debounce saves so a burst of keystrokes results in a single
+        # serialization + disk write instead of one per character.
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self.save_note)
+
+        # Throttle opacity changes to ~60 Hz while the slider is dragged;
+        # every setWindowOpacity call forces a compositor repaint.
+        self._pending_opacity = None
+        self._opacity_timer = QTimer(self)
+        self._opacity_timer.setSingleShot(True)
+        self._opacity_timer.setInterval(16)
+        self._opacity_timer.timeout.connect(self._apply_pending_opacity)
+
         self.apply_styles()
         self.update_pin_state(self.note_data.get("pinned", False))
         self.transparency_slider.setValue(int(self.note_data.get("transparency", 1.0) * 100))
         self.update_transparency(self.transparency_slider.value())
 
-        self.title_entry.textChanged.connect(self.save_note)
-        self.text_edit.textChanged.connect(self.save_note)
+        self.title_entry.textChanged.connect(self._on_title_changed)
+        self.text_edit.textChanged.connect(self._schedule_save)
         self.pin_button.toggled.connect(self.update_pin_state)
         self.color_button.clicked.connect(self.show_color_dialog)
         self.delete_button.clicked.connect(self.delete_note)
-        self.transparency_slider.valueChanged.connect(self.update_transparency)
-        self.transparency_slider.sliderReleased.connect(self.app.save_notes)
+        self.transparency_slider.valueChanged.connect(self._queue_transparency)
+        self.transparency_slider.sliderReleased.connect(self.save_note)
 
         # Formatting connections
         self.bold_button.clicked.connect(lambda: self.set_text_format('bold'))
@@ -179,67 +312,7 @@ class NoteWindow(QWidget):
         self.addAction(underline_action)
         
     def apply_styles(self):
-        color = self.note_data.get("color", "#FFFF99")
-        
-        # Convert hex to rgb for hover effects
-        r, g, b = tuple(int(color.lstrip('#')[i:i+2], 16) for i in (0, 2, 4))
-        # Create a slightly darker shade for hover
-        hover_r = max(0, r - 20)
-        hover_g = max(0, g - 20)
-        hover_b = max(0, b - 20)
-        hover_color = f"#{hover_r:02x}{hover_g:02x}{hover_b:02x}"
-        
-        style = f"""
-            NoteWindow, QWidget {{ background-color: {color}; }}
-            QLineEdit {{ background-color: {color}; }}
-            QTextEdit {{ background-color: {color}; border: none; }}
-            
-            /* Blended button style - no borders, transparent background */
-            QPushButton {{
-                background-color: transparent;
-                border: none;
-                border-radius: 3px;
-                padding: 4px 8px;
-                color: #555;
-                font-size: 11px;
-            }}
-            QPushButton:hover {{
-                background-color: {hover_color};
-            }}
-            QPushButton:pressed {{
-                background-color: rgba(0, 0, 0, 0.1);
-            }}
-            QPushButton:checked {{
-                background-color: rgba(0, 0, 0, 0.15);
-                font-weight: bold;
-            }}
-            
-            QSlider::groove:horizontal {{
-                border: 1px solid #bbb;
-                background: white;
-                height: 5px;
-                border-radius: 2px;
-            }}
-            QSlider::sub-page:horizontal {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #66e, stop:1 #bbf);
-                height: 10px;
-                border-radius: 2px;
-            }}
-            QSlider::handle:horizontal {{
-                background: #777;
-                border: 1px solid #5c5c5c;
-                width: 14px;
-                margin: -5px 0;
-                border-radius: 7px;
-            }}
-            QFrame {{ background-color: {color}; }}
-            QLabel {{ 
-                background-color: {color}; 
-                color: #888;
-                font-size: 10px;
-            }}
-        """
-        self.setStyleSheet(style)
+        self.setStyleSheet(_style_for_color(self.note_data.get("color", "#FFFF99")))
         
     def update_pin_state(self, pinned):
         self.setWindowFlag(Qt.WindowType.WindowStaysOnTopHint, pinned)
@@ -249,6 +322,16 @@ class NoteWindow(QWidget):
         self.show() # Re-show to apply window flag change
         self.save_note()
 
+    def _queue_transparency(self, value):
+        self._pending_opacity = value
+        if not self._opacity_timer.isActive():
+            self._opacity_timer.start()
+
+    def _apply_pending_opacity(self):
+        if self._pending_opacity is not None:
+            self.update_transparency(self._pending_opacity)
+            self._pending_opacity = None
+
     def update_transparency(self, value):
         alpha = value / 100.0
         self.setWindowOpacity(alpha)
@@ -258,7 +341,27 @@ class NoteWindow(QWidget):
     def show_color_dialog(self):
         self.app.show_color_chooser([self.note_id])
     
+    def _ensure_rich(self):
+        """Swap the plain editor for a QTextEdit the first time formatting is used."""
+        if self.is_rich:
+            return
+        plain = self.text_edit
+        rich = QTextEdit()
+        rich.blockSignals(True)
+        rich.setPlainText(plain.toPlainText())
+        rich.blockSignals(False)
+        index = self.main_layout.indexOf(plain)
+        self.main_layout.removeWidget(plain)
+        plain.deleteLater()
+        self.text_edit = rich
+        self.main_layout.insertWidget(index, rich)
+        rich.textChanged.connect(self._schedule_save)
+        rich.cursorPositionChanged.connect(self.update_formatting_buttons)
+        self.is_rich = True
+        self.note_data["is_rich"] = True
+
     def set_text_format(self, style):
+        self._ensure_rich()
         # This function now applies formatting to selected text,
         # or sets the format for text that is about to be typed if there is no selection.
         
@@ -282,6 +385,7 @@ class NoteWindow(QWidget):
         self.text_edit.setFocus()
 
     def show_font_dialog(self):
+        self._ensure_rich()
         cursor = self.text_edit.textCursor()
 
         # Get the current font to initialize the dialog.
@@ -300,25 +404,59 @@ class NoteWindow(QWidget):
         self.text_edit.setFocus()
 
     def update_formatting_buttons(self):
+        if not self.is_rich:
+            return
         fmt = self.text_edit.currentCharFormat()
         self.bold_button.setChecked(fmt.fontWeight() == QFont.Weight.Bold)
         self.italic_button.setChecked(fmt.fontItalic())
         self.underline_button.setChecked(fmt.fontUnderline())
 
-    def update_data_from_ui(self):
-        """Reads UI values (except transparency) and updates the in-memory note_data dictionary."""
+    def _on_title_changed(self):
+        self.update_title_from_ui()
+        self._schedule_save()
+
+    def update_title_from_ui(self):
+        """Cheap title sync; safe to run on every title keystroke."""
         if self.note_id not in self.app.notes:
             return
         self.note_data["title"] = self.title_entry.text()
-        self.note_data["content_html"] = self.text_edit.toHtml()
-        self.note_data["content_text"] = self.text_edit.toPlainText()
+        self.app._mark_note_dirty(self.note_id)
         self.setWindowTitle(self.note_data["title"])
 
+    def update_body_from_ui(self):
+        """Serialize the document body into note_data.
+
+        toHtml/toPlainText are expensive for large documents, so this only
+        runs from the debounced save path (and close/quit), never per
+        keystroke.
+        """
+        if self.note_id not in self.app.notes:
+            return
+        if self.is_rich:
+            self.note_data["content_html"] = self.text_edit.toHtml()
+        else:
+            self.note_data["content_html"] = ""
+        self.note_data["content_text"] = self.text_edit.toPlainText()
+        self.note_data["is_rich"] = self.is_rich
+        self.app._mark_note_dirty(self.note_id)
+
+    def update_data_from_ui(self):
+        """Reads UI values (except transparency) and updates the in-memory note_data dictionary."""
+        self.update_title_from_ui()
+        self.update_body_from_ui()
+
+    def _schedule_save(self):
+        """Restart the debounce timer; the actual save runs after the user pauses."""
+        self._save_timer.start()
+
     def save_note(self):
         """Updates the in-memory data and saves all notes to the file."""
+        self._save_timer.stop()
         self.update_data_from_ui()
+        if self.note_id in self.app.notes:
+            self.app._index_note(self.note_id)
         self.app.save_notes()
-        self.app.refresh_list()
+        self.app.refresh_one(self.note_id)
 
     def delete_note(self):
         if self.app.confirm_delete(f"Delete note '{self.note_data['title']}'?"):
@@ -339,7 +477,7 @@ class NoteWindow(QWidget):
         self.save_note()
         if self.note_id in self.app.open_windows:
             del self.app.open_windows[self.note_id]
-        self.app.save_state()
+        self.app._schedule_state_save()
         self.app.save_positions()
         super().closeEvent(event)
 
@@ -358,8 +496,7 @@ class StickyNotesManagerWindow(QMainWindow):
         """
         if event.type() == QEvent.Type.WindowStateChange:
             if self.windowState() & Qt.WindowState.WindowMinimized:
-                self.app.save_positions()
-                self.app.save_state()
+                self.app._save_all()
                 self.hide()
                 self.app.tray_icon.show()
                 event.accept()
@@ -386,9 +523,18 @@ class StickyNotesApp:
         # --- App Data ---
         self.notes = {}
         self.open_windows = {}
+        self._item_by_id = {}
         self.search_query = ""
         self.is_quitting = False
+        self._last_serialized = b""
+        # Per-note serialized fragments: an edit to one note only
+        # re-serializes that note; the rest reuse their cached bytes.
+        self._note_fragments = {}
+        self._dirty_notes = set()
         self.load_notes()
+        # positions.json is parsed once here; saves update this dict in
+        # memory and serialize it, instead of re-reading the file each time.
+        self.positions = self.load_positions()
 
         # --- Qt App Initialization ---
         self.app = QApplication(sys.argv)
@@ -398,8 +544,15 @@ class StickyNotesApp:
         # --- Global Hotkey Setup ---
         self.hotkey_signaler = HotkeySignaler()
         self.hotkey_signaler.create_note_signal.connect(self.create_note_with_content)
-        self.start_hotkey_listener()
-        
+
+        # Debounced state writes: restoring or closing a batch of windows
+        # coalesces into a single state.json write.
+        self._state_timer = QTimer()
+        self._state_timer.setSingleShot(True)
+        self._state_timer.setInterval(200)
+        self._state_timer.timeout.connect(self.save_state)
+
+
         self.init_tray_icon()
         self.init_manager_ui()
         self.restore_open_notes()
@@ -450,6 +603,11 @@ class StickyNotesApp:
 
     def start_hotkey_listener(self):
         """Start the global hotkey listener in a background thread"""
+        # Imported here rather than at module level: pynput probes the
+        # platform input APIs on import, which is too slow for the startup
+        # critical path.
+        from pynput import keyboard
+
         def on_activate():
             # Run copy in a separate thread with delay to allow keys to release
             def delayed_copy():
@@ -522,6 +680,8 @@ class StickyNotesApp:
             "pinned": False,
             "transparency": 1.0
         }
+        self._sorted_ids.insert(0, note_id)
+        self._index_note(note_id)
         self.save_notes()
         self.refresh_list()
         self.open_note(note_id)
@@ -538,66 +698,151 @@ class StickyNotesApp:
     def run(self):
         self.manager.show()
         self.tray_icon.hide()
+        # Defer hotkey setup until after the first paint so the manager
+        # window appears without waiting on pynput.
+        QTimer.singleShot(0, self.start_hotkey_listener)
         sys.exit(self.app.exec())
         
     def create_icon(self):
         icon_path_str = resource_path("icon.png")
         icon_path = Path(icon_path_str)
         if not icon_path.exists():
-            img = Image.new('RGB', (64, 64), color='black')
-            d = ImageDraw.Draw(img)
-            d.text((10, 10), "SN", fill='white')
-            img.save(icon_path_str)
+            # Draw the fallback icon with Qt directly; no need to pull in
+            # PIL just for a 64x64 placeholder.
+            pixmap = QPixmap(64, 64)
+            pixmap.fill(QColor('black'))
+            painter = QPainter(pixmap)
+            painter.setPen(QColor('white'))
+            painter.drawText(10, 30, "SN")
+            painter.end()
+            pixmap.save(icon_path_str, 'PNG')
+            return QIcon(pixmap)
         return QIcon(icon_path_str)
 
     def load_notes(self):
         if self.notes_file.exists():
             try:
-                with open(self.notes_file, 'r') as f:
-                    self.notes = json.load(f)
-            except json.JSONDecodeError:
+                self.notes = _loads(self.notes_file.read_bytes())
+            except ValueError:
                 self.notes = {}
         else:
             self.notes = {}
+        # Newest-first display order, maintained incrementally on
+        # create/delete so UI refreshes never need to re-sort.
+        self._sorted_ids = sorted(
+            self.notes, key=lambda nid: self.notes[nid].get("created", ""), reverse=True)
+        # Lowercased (title, content) per note so search filtering doesn't
+        # re-lowercase every note body on each keystroke.
+        self._search_index = {}
+        for note_id in self.notes:
+            self._index_note(note_id)
+
+    def _index_note(self, note_id):
+        note = self.notes[note_id]
+        self._search_index[note_id] = (
+            note.get("title", "Note").lower(),
+            note.get("content_text", "").lower(),
+        )
+
+    def _write_tmp(self, path, payload):
+        tmp = path.with_suffix('.tmp')
+        with open(tmp, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        return tmp
 
-    def save_notes(self):
-        with open(self.notes_file, 'w') as f:
-            json.dump(self.notes, f, indent=2)
+    def _atomic_write(self, path, payload):
+        """Write bytes to a temp file, fsync, then rename over the target.
+
+        A crash mid-write can never leave a truncated file behind, and the
+        single fsync per commit keeps syscall overhead down.
+        """
+        os.replace(self._write_tmp(path, payload), path)
+
+    def _atomic_write_json(self, path, obj):
+        self._atomic_write(path, _dumps(obj))
+
+    def _mark_note_dirty(self, note_id):
+        self._dirty_notes.add(note_id)
+
+    def save_notes(self, pretty=False):
+        if pretty:
+            payload = _dumps(self.notes, pretty=True)
+        else:
+            # Assemble the document from per-note fragments, re-serializing
+            # only the notes touched since the last save.
+            parts = []
+            for note_id, note in self.notes.items():
+                frag = self._note_fragments.get(note_id)
+                if frag is None or note_id in self._dirty_notes:
+                    frag = _dumps(note)
+                    self._note_fragments[note_id] = frag
+                parts.append(_dumps(note_id) + b':' + frag)
+            self._dirty_notes.clear()
+            payload = b'{' + b','.join(parts) + b'}'
+        # Spurious textChanged signals (e.g. from setHtml on open) produce
+        # identical payloads; skip the disk write entirely in that case.
+        if payload == self._last_serialized:
+            return
+        self._atomic_write(self.notes_file, payload)
+        self._last_serialized = payload
 
     def load_state(self):
         if self.state_file.exists():
             try:
-                with open(self.state_file, 'r') as f:
-                    return json.load(f)
-            except json.JSONDecodeError:
+                return _loads(self.state_file.read_bytes())
+            except ValueError:
                 return {"open_notes": []}
         return {"open_notes": []}
 
+    def _schedule_state_save(self):
+        self._state_timer.start()
+
     def save_state(self):
+        self._state_timer.stop()
         state = {"open_notes": list(self.open_windows.keys())}
-        with open(self.state_file, 'w') as f:
-            json.dump(state, f, indent=2)
+        self._atomic_write_json(self.state_file, state)
 
     def load_positions(self):
         if self.positions_file.exists():
             try:
-                with open(self.positions_file, 'r') as f:
-                    return json.load(f)
-            except json.JSONDecodeError:
+                return _loads(self.positions_file.read_bytes())
+            except ValueError:
                 return {}
         return {}
 
-    def save_positions(self):
-        positions = self.load_positions()
+    def _current_positions(self):
         for note_id, window in list(self.open_windows.items()):
             if window.isVisible() and note_id in self.notes:
                 # Save position regardless of is_new flag
-                positions[note_id] = {
+                self.positions[note_id] = {
                     "x": window.x(), "y": window.y(),
                     "width": window.width(), "height": window.height()
                 }
-        with open(self.positions_file, 'w') as f:
-            json.dump(positions, f, indent=2)
+        return self.positions
+
+    def save_positions(self):
+        self._atomic_write_json(self.positions_file, self._current_positions())
+
+    def _save_all(self, final=False):
+        """Commit notes, state and positions as one batch.
+
+        All three temp files are written and fsynced first, then renamed
+        back-to-back, so a multi-file save is one pass through the
+        filesystem instead of three interleaved write/rename cycles.
+        """
+        notes_payload = _dumps(self.notes, pretty=final)
+        state = {"open_notes": list(self.open_windows.keys())}
+        writes = [
+            (self.notes_file, notes_payload),
+            (self.state_file, _dumps(state)),
+            (self.positions_file, _dumps(self._current_positions())),
+        ]
+        tmps = [(self._write_tmp(path, payload), path) for path, payload in writes]
+        for tmp, path in tmps:
+            os.replace(tmp, path)
+        self._last_serialized = notes_payload
 
     def init_manager_ui(self):
         self.manager = StickyNotesManagerWindow(self)
@@ -643,6 +888,8 @@ class StickyNotesApp:
 
         # Notes List
         self.notes_listbox = QListWidget()
+        # Rows are all simple one-line text; skip per-item size hints.
+        self.notes_listbox.setUniformItemSizes(True)
         self.notes_listbox.setSelectionMode(QListWidget.SelectionMode.ExtendedSelection)
         self.notes_listbox.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         main_layout.addWidget(self.notes_listbox)
@@ -694,36 +941,61 @@ class StickyNotesApp:
         self.create_note_with_content("")
 
     def refresh_list(self):
-        self.notes_listbox.clear()
-        search_query = self.search_entry.text().lower()
-        
-        sorted_notes = sorted(self.notes.items(), key=lambda x: x[1].get("created", ""), reverse=True)
-        
-        for note_id, note in sorted_notes:
-            title = note.get("title", "Note")
-            content = note.get("content_text", "")
-            
-            if search_query and search_query not in title.lower() and search_query not in content.lower():
-                continue
-                
-            item = QListWidgetItem(title)
-            item.setData(Qt.ItemDataRole.UserRole, note_id) # Store note_id in the item
-            item.setBackground(QColor(note.get("color", "#FFFF99")))
-            self.notes_listbox.addItem(item)
-            
-    def open_note(self, note_id):
+        # Suppress paints during the rebuild so N item inserts cost one
+        # repaint instead of N.
+        self.notes_listbox.setUpdatesEnabled(False)
+        try:
+            self.notes_listbox.clear()
+            self._item_by_id = {}
+            search_query = self.search_entry.text().lower()
+
+            for note_id in self._sorted_ids:
+                note = self.notes[note_id]
+                title = note.get("title", "Note")
+
+                if search_query:
+                    title_lower, content_lower = self._search_index[note_id]
+                    if search_query not in title_lower and search_query not in content_lower:
+                        continue
+
+                item = QListWidgetItem(title)
+                item.setData(Qt.ItemDataRole.UserRole, note_id) # Store note_id in the item
+                item.setBackground(QColor(note.get("color", "#FFFF99")))
+                self.notes_listbox.addItem(item)
+                self._item_by_id[note_id] = item
+        finally:
+            self.notes_listbox.setUpdatesEnabled(True)
+
+    def refresh_one(self, note_id):
+        """Update a single list row in place instead of rebuilding the list.
+
+        Falls back to a full refresh when the note isn't currently shown
+        (e.g. it is filtered out by an active search).
+        """
+        note = self.notes.get(note_id)
+        item = self._item_by_id.get(note_id)
+        if note is None or item is None:
+            self.refresh_list()
+            return
+        item.setText(note.get("title", "Note"))
+        item.setBackground(QColor(note.get("color", "#FFFF99")))
+
+    def open_note(self, note_id, update_state=True):
         if note_id in self.open_windows and self.open_windows[note_id].isVisible():
             self.open_windows[note_id].raise_()
             self.open_windows[note_id].activateWindow()
             return
             
         if note_id in self.notes:
+            newly_opened = note_id not in self.open_windows
             note_window = NoteWindow(note_id, self)
             self.open_windows[note_id] = note_window
             note_window.show()
             note_window.raise_()
             note_window.activateWindow()
-            self.save_state()
+            # Only persist state when the set of open notes actually changed.
+            if newly_opened and update_state:
+                self._schedule_state_save()
 
     def on_note_double_click(self, item):
         note_id = item.data(Qt.ItemDataRole.UserRole)
@@ -745,6 +1017,10 @@ class StickyNotesApp:
         for note_id in note_ids:
             if note_id in self.notes:
                 del self.notes[note_id]
+                self._sorted_ids.remove(note_id)
+                self._search_index.pop(note_id, None)
+                self._note_fragments.pop(note_id, None)
+                self._dirty_notes.discard(note_id)
             if note_id in self.open_windows:
                 self.open_windows[note_id].close()
         self.save_notes()
@@ -774,6 +1050,7 @@ class StickyNotesApp:
             for note_id in note_ids:
                 if note_id in self.notes:
                     self.notes[note_id]["color"] = hex_color
+                    self._mark_note_dirty(note_id)
                     if note_id in self.open_windows:
                         self.open_windows[note_id].note_data["color"] = hex_color
                         self.open_windows[note_id].apply_styles()
@@ -788,9 +1065,18 @@ class StickyNotesApp:
 
     def restore_open_notes(self):
         state = self.load_state()
-        for note_id in state["open_notes"]:
-            if note_id in self.notes:
-                self.open_note(note_id)
+        to_restore = [nid for nid in state["open_notes"] if nid in self.notes]
+        if not to_restore:
+            return
+        # Batch the opens: one wait cursor for the whole restore and a
+        # single state write at the end instead of one per window.
+        self.app.setOverrideCursor(Qt.CursorShape.WaitCursor)
+        try:
+            for note_id in to_restore:
+                self.open_note(note_id, update_state=False)
+        finally:
+            self.save_state()
+            self.app.restoreOverrideCursor()
 
     def quit_app(self):
         """Saves all data and exits the application."""
@@ -799,11 +1085,10 @@ class StickyNotesApp:
         # Manually update text/title from open windows before saving.
         # Transparency is already up-to-date in the data model from sliderReleased.
         for window in self.open_windows.values():
+            window._save_timer.stop()
             window.update_data_from_ui()
-        
-        self.save_notes()
-        self.save_positions()
-        self.save_state()
+
+        self._save_all(final=True)
         QApplication.instance().quit()
 
 
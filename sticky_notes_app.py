@@ -1,22 +1,81 @@
 import tkinter as tk
 from tkinter import simpledialog, messagebox, scrolledtext, font
+import bisect
 import json
+import logging
 import os
 import sys
 from pathlib import Path
 from datetime import datetime
-from PIL import Image, ImageDraw, ImageGrab
 import pystray
+import queue
 from threading import Thread
 
+# orjson is several times faster than the stdlib encoder and matters here
+# because notes.json (including the verbose content_dump payload) is
+# rewritten on every flush; fall back to compact stdlib json without it.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj):
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode()
+
+
+log = logging.getLogger(__name__)
+
+# Dump event types that carry note content.  text.dump(all=True) also emits
+# "mark" and "window" entries (insert/current marks, embedded widgets) that
+# the replay in open_note never consumes; dropping them shrinks the stored
+# payload considerably since marks repeat on every line.
+_DUMP_KEYS = frozenset({"text", "tagon", "tagoff", "image"})
+
+def _build_retint(window):
+    """Compile a recolor routine for one note window.
+
+    Captures the window's tintable widgets as a closure local, so repeated
+    color changes run a tight loop with no attribute lookups.
+    """
+    widgets = window._tintable_widgets
+
+    def retint(color):
+        for widget in widgets:
+            widget.configure(bg=color)
+    return retint
+
+
+# Color chooser palette.  A tuple of pairs rather than a dict: only ever
+# iterated in order, never looked up by name.
+_COLOR_PALETTE = (
+    ("Yellow", "#FFFF99"), ("Blue", "#99CCFF"), ("Green", "#99FF99"),
+    ("Pink", "#FFB6C1"), ("Orange", "#FFCC99"), ("Purple", "#CC99FF"),
+    ("Red", "#FF9999"), ("Cyan", "#99FFFF"), ("Lime", "#CCFF99"),
+    ("Salmon", "#FFA07A"), ("Lavender", "#E6CCFF"), ("Peach", "#FFCCB3"),
+    ("Mint", "#B3FFCC"), ("Sky", "#B3DDFF"), ("Gold", "#FFE699"),
+    ("Rose", "#FFB3D9"), ("Teal", "#99CCCC"), ("Plum", "#DD99FF"),
+    ("Coral", "#FF9999"), ("Khaki", "#FFFF99"), ("Apricot", "#FFCC99"),
+    ("Powder Blue", "#B0E0E6"), ("Honeydew", "#F0FFF0"), ("Thistle", "#D8BFD8"),
+    ("Wheat", "#F5DEB3"), ("Beige", "#F5F5DC"), ("Cornsilk", "#FFF8DC"),
+    ("Linen", "#FAF0E6"), ("Misty Rose", "#FFE4E1"), ("Floral White", "#FFFAF0"),
+    ("Seashell", "#FFF5EE"), ("Antique White", "#FAEBD7"), ("Cream", "#FFFDD0"),
+    ("Light Yellow", "#FFFFE0"), ("Light Green", "#90EE90"), ("Light Blue", "#ADD8E6"),
+    ("Light Pink", "#FFB6C1"), ("Light Gray", "#D3D3D3"), ("Dark Salmon", "#E9967A"),
+    ("Light Salmon", "#FFA07A"), ("Light Sea Green", "#20B2AA"),
+)
+
+
+# PyInstaller creates a temp folder and stores its path in _MEIPASS;
+# resolved once at import instead of per resource_path call.
+BASE_PATH = getattr(sys, "_MEIPASS", os.path.abspath("."))
+
+
 def resource_path(relative_path):
     """ Get absolute path to resource, works for dev and for PyInstaller """
-    try:
-        # PyInstaller creates a temp folder and stores path in _MEIPASS
-        base_path = sys._MEIPASS
-    except Exception:
-        base_path = os.path.abspath(".")
-    return os.path.join(base_path, relative_path)
+    return os.path.join(BASE_PATH, relative_path)
 
 class StickyNotesApp:
     def __init__(self):
@@ -32,17 +91,60 @@ class StickyNotesApp:
         self.icon_ico_path = self.data_dir / "icon.ico"
         if not self.icon_ico_path.exists():
             try:
+                # PIL is imported where it is needed so its ~40ms import
+                # cost is only paid on paths that touch image data.
+                from PIL import Image
                 icon_png_path = resource_path("icon.png")
                 img = Image.open(icon_png_path)
                 img.save(self.icon_ico_path, format='ICO', sizes=[(32, 32)])
             except Exception as e:
-                print(f"Could not create icon for windows: {e}")
+                log.warning("Could not create icon for windows: %s", e)
 
         self.notes = {}
         self.open_windows = {}
+        # Ids of note windows known to be alive; a plain set membership
+        # test replaces winfo_exists round-trips on the selection paths.
+        self._live_window_ids = set()
+        # Decoded PhotoImage objects keyed by file path, shared across
+        # window opens so reopening a note doesn't re-decode its PNGs.
+        self._image_cache = {}
+        # font.Font objects keyed by (size, bold, italic, underline); each
+        # creation is a Tcl round-trip, so share them across all windows.
+        self._font_cache = {}
+        # Parsed style tags keyed by tag name; long notes replay the same
+        # few tags hundreds of times, so parse each one once.
+        self._tag_parse_cache = {}
         self.tray_thread = None
         self.search_query = ""
+        self._search_after = None
+        self._save_after = None
+        self._pending_refresh = False
+        # Deferred text-widget dumps (note_id -> callable); the expensive
+        # dump(all=True) walk runs at flush time, not per keystroke.
+        self._pending_dumps = {}
+        # (note_id, title, color) rows of the previous listbox render,
+        # used to diff instead of rebuilding the widget on every refresh.
+        self._listbox_state = []
+        self._listbox_ids = []
+        # Serialized JSON fragment per note: a flush re-encodes only notes
+        # touched since the last write and reuses cached bytes for the rest.
+        self._note_fragments = {}
+        self._dirty_notes = set()
+        # The color chooser Toplevel is built once and hidden/reshown;
+        # rebuilding its 40 buttons per open is all Tcl round-trips.
+        self._color_chooser = None
+        self._color_buttons = []
+        # File writes happen on a worker thread so slow disks never stall
+        # the Tk loop; serialization stays on the main thread and only the
+        # finished bytes cross over.
+        self._io_queue = queue.Queue()
+        self._io_thread = Thread(target=self._io_worker, daemon=True)
+        self._io_thread.start()
         self.load_notes()
+        # positions.json is parsed once here; window geometry is tracked in
+        # memory and flushed to disk when the manager closes.
+        self._positions = self.load_positions()
+        self._rebuild_indexes()
         self.create_manager_window()
         self.restore_open_notes()
 
@@ -52,23 +154,163 @@ class StickyNotesApp:
             try:
                 with open(self.notes_file, 'r') as f:
                     self.notes = json.load(f)
-                    print(f"[LOAD_NOTES] Loaded notes: {list(self.notes.keys())}")
-                    for note_id, note in self.notes.items():
-                        print(f"  - {note_id}: is_new={note.get('is_new', False)}")
+                    log.debug("[LOAD_NOTES] Loaded %d notes", len(self.notes))
             except:
                 self.notes = {}
-                print("[LOAD_NOTES] Failed to load notes")
+                log.debug("[LOAD_NOTES] Failed to load notes")
         else:
             self.notes = {}
-            print("[LOAD_NOTES] Notes file does not exist")
+            log.debug("[LOAD_NOTES] Notes file does not exist")
+
+    def _parse_style_tag(self, tag):
+        """Parse a 'style_{size}_{bold}_{italic}_{underline}' tag, memoized.
+
+        Returns a (size, is_bold, is_italic, is_underline) tuple, or None
+        for malformed tags.
+        """
+        try:
+            return self._tag_parse_cache[tag]
+        except KeyError:
+            pass
+        parsed = None
+        parts = tag.split('_')
+        if len(parts) == 5:
+            try:
+                parsed = (int(parts[1]), parts[2] == 'True',
+                          parts[3] == 'True', parts[4] == 'True')
+            except ValueError:
+                parsed = None
+        self._tag_parse_cache[tag] = parsed
+        return parsed
+
+    def _make_blob(self, note):
+        """Lowercased title+content used for search matching."""
+        content = note.get("content_text", note.get("content", ""))
+        return (note.get("title", "Note") + "\x1f" + content).lower()
+
+    def _rebuild_indexes(self):
+        """Rebuild the display-order and search caches from self.notes.
+
+        _sorted_ids is kept ascending by creation time so incremental
+        inserts can bisect; display paths iterate it in reverse.
+        """
+        self._sorted_ids = sorted(
+            self.notes, key=lambda nid: self.notes[nid].get("created", ""))
+        self._displayed_cache = None
+        self._search_blob = {nid: self._make_blob(self.notes[nid]) for nid in self.notes}
+
+    def _touch(self, note_id):
+        """Refresh the cached search text for one note after an edit."""
+        self._search_blob[note_id] = self._make_blob(self.notes[note_id])
+        self._dirty_notes.add(note_id)
+        self._displayed_cache = None
+
+    def _forget_note(self, note_id):
+        """Drop a deleted note from the caches.
+
+        Must be called before the note is removed from self.notes so the
+        sorted list can bisect on its created timestamp.
+        """
+        note = self.notes.get(note_id)
+        if note_id in self._search_blob:
+            del self._search_blob[note_id]
+        if note is not None:
+            key = note.get("created", "")
+            i = bisect.bisect_left(
+                self._sorted_ids, key,
+                key=lambda nid: self.notes[nid].get("created", ""))
+            while i < len(self._sorted_ids):
+                if self._sorted_ids[i] == note_id:
+                    del self._sorted_ids[i]
+                    break
+                i += 1
+        elif note_id in self._sorted_ids:
+            self._sorted_ids.remove(note_id)
+        self._note_fragments.pop(note_id, None)
+        self._dirty_notes.discard(note_id)
+        self._displayed_cache = None
+
+    def _displayed_ids(self):
+        """Note ids currently shown in the listbox, newest first.
+
+        The computed list is cached and invalidated on note mutation or
+        search change, so repeated UI events (right-click, delete, close)
+        between edits share one filter pass.
+        """
+        if self._displayed_cache is not None:
+            return self._displayed_cache
+        query = self.search_query
+        if not query:
+            # No filter active: the display is just the sorted list reversed
+            displayed = list(reversed(self._sorted_ids))
+        else:
+            blobs = self._search_blob
+            displayed = [note_id for note_id in reversed(self._sorted_ids)
+                         if query in blobs[note_id]]
+        self._displayed_cache = displayed
+        return displayed
+
+    def _io_worker(self):
+        """Consume (path, payload) jobs from the queue and write them out."""
+        while True:
+            job = self._io_queue.get()
+            if job is None:
+                self._io_queue.task_done()
+                break
+            path, payload = job
+            try:
+                with open(path, 'wb') as f:
+                    f.write(payload)
+            except OSError as e:
+                log.warning("Failed to write %s: %s", path, e)
+            self._io_queue.task_done()
+
+    def _write_async(self, path, payload):
+        """Hand a finished byte payload to the writer thread."""
+        self._io_queue.put((path, payload))
+
+    def _drain_io(self):
+        """Block until every queued write has hit the disk."""
+        self._io_queue.join()
 
     def save_notes(self):
         """Save notes to file"""
-        print(f"[SAVE_NOTES] Saving {len(self.notes)} notes")
+        # Serialize any text widgets with pending edits before writing
+        for note_id, sync_dump in list(self._pending_dumps.items()):
+            if note_id in self.notes:
+                try:
+                    sync_dump()
+                except tk.TclError:
+                    pass  # window already destroyed
+        self._pending_dumps.clear()
+        log.debug("[SAVE_NOTES] Saving %d notes", len(self.notes))
+        # Assemble the document from per-note fragments so a one-note edit
+        # costs one fragment encode plus a byte join, not a full-dict dump.
+        parts = []
         for note_id, note in self.notes.items():
-            print(f"  - {note_id}: is_new={note.get('is_new', False)}")
-        with open(self.notes_file, 'w') as f:
-            json.dump(self.notes, f, indent=2)
+            frag = self._note_fragments.get(note_id)
+            if frag is None or note_id in self._dirty_notes:
+                frag = _dumps(note)
+                self._note_fragments[note_id] = frag
+            parts.append(_dumps(note_id) + b':' + frag)
+        self._dirty_notes.clear()
+        self._write_async(self.notes_file, b'{' + b','.join(parts) + b'}')
+
+    def _schedule_save(self):
+        """Coalesce bursts of edits into one notes.json write every ~500ms."""
+        if self._save_after is None:
+            self._save_after = self.manager.after(500, self._on_save_timer)
+
+    def _on_save_timer(self):
+        self._save_after = None
+        self.save_notes()
+
+    def _flush_notes(self):
+        """Write any pending note changes to disk immediately."""
+        if self._save_after is not None:
+            self.manager.after_cancel(self._save_after)
+            self._save_after = None
+            self.save_notes()
 
     def load_state(self):
         """Load which notes were open"""
@@ -85,8 +327,7 @@ class StickyNotesApp:
         state = {
             "open_notes": list(self.open_windows.keys())
         }
-        with open(self.state_file, 'w') as f:
-            json.dump(state, f, indent=2)
+        self._write_async(self.state_file, _dumps(state))
 
     def load_positions(self):
         """Load saved note positions"""
@@ -94,36 +335,31 @@ class StickyNotesApp:
             try:
                 with open(self.positions_file, 'r') as f:
                     positions = json.load(f)
-                    print(f"[LOAD_POSITIONS] Loaded positions for: {list(positions.keys())}")
+                    log.debug("[LOAD_POSITIONS] Loaded positions for %d notes", len(positions))
                     return positions
             except:
-                print("[LOAD_POSITIONS] Failed to load positions")
+                log.debug("[LOAD_POSITIONS] Failed to load positions")
                 return {}
-        print("[LOAD_POSITIONS] Positions file does not exist")
+        log.debug("[LOAD_POSITIONS] Positions file does not exist")
         return {}
 
     def save_positions(self):
         """Save note positions"""
-        positions = self.load_positions()
-        print(f"[SAVE_POSITIONS] Checking {len(self.open_windows)} open windows")
+        positions = self._positions
+        log.debug("[SAVE_POSITIONS] Checking %d open windows", len(self.open_windows))
         for note_id, window in list(self.open_windows.items()):
-            if note_id not in self.notes:
+            note = self.notes.get(note_id)
+            if note is None or note.get("is_new"):
+                log.debug("    -> SKIPPING %s", note_id)
                 continue
-            is_new = self.notes[note_id].get("is_new", False)
-            print(f"  - {note_id}: is_new={is_new}, exists={window.winfo_exists()}")
-            if window.winfo_exists() and not is_new:
-                positions[note_id] = {
-                    "x": window.winfo_x(),
-                    "y": window.winfo_y(),
-                    "width": window.winfo_width(),
-                    "height": window.winfo_height()
-                }
-                print(f"    -> SAVING position: {positions[note_id]}")
-            else:
-                print(f"    -> SKIPPING (is_new={is_new}, exists={window.winfo_exists()})")
-        print(f"[SAVE_POSITIONS] Final saved positions: {list(positions.keys())}")
-        with open(self.positions_file, 'w') as f:
-            json.dump(positions, f, indent=2)
+            positions[note_id] = {
+                "x": window.winfo_x(),
+                "y": window.winfo_y(),
+                "width": window.winfo_width(),
+                "height": window.winfo_height()
+            }
+            log.debug("    -> SAVING position: %s", positions[note_id])
+        self._write_async(self.positions_file, _dumps(positions))
 
     def create_manager_window(self):
         """Create the sticky notes manager window"""
@@ -185,8 +421,19 @@ class StickyNotesApp:
         self.manager.bind("<Control-Shift-N>", lambda e: self.create_new_note())
 
     def on_search_change(self, *args):
-        """Handle search input changes"""
-        self.search_query = self.search_var.get().lower()
+        """Handle search input changes (debounced)"""
+        # Only filter once the user pauses typing; a burst of keystrokes
+        # would otherwise rebuild the listbox once per character.
+        if self._search_after:
+            self.manager.after_cancel(self._search_after)
+        self._search_after = self.manager.after(150, self._do_search)
+
+    def _do_search(self):
+        self._search_after = None
+        # Normalized once here; the filter loops rely on the query already
+        # being lowercased and stripped.
+        self.search_query = self.search_var.get().strip().lower()
+        self._displayed_cache = None
         self.refresh_list()
 
     def create_tray_icon(self):
@@ -194,6 +441,8 @@ class StickyNotesApp:
         if hasattr(self, 'tray_thread') and self.tray_thread and self.tray_thread.is_alive():
             return
 
+        from PIL import Image, ImageDraw
+
         icon_path = resource_path("icon.png")
         # Create a default icon if not found
         if not os.path.exists(icon_path):
@@ -236,24 +485,44 @@ class StickyNotesApp:
         self.on_manager_close()
 
     def refresh_list(self):
-        """Refresh the notes list display"""
-        self.notes_listbox.delete(0, tk.END)
-        for note_id, note in sorted(self.notes.items(), key=lambda x: x[1].get("created", ""), reverse=True):
-            title = note.get("title", "Note")
-            content = note.get("content_text", note.get("content", ""))
-            
-            # Filter based on search query
-            if self.search_query:
-                if self.search_query not in title.lower() and self.search_query not in content.lower():
+        """Refresh the notes list display.
+
+        Diffs against the previous render: when the visible rows are the
+        same notes in the same order (the common case — a title edit), only
+        the changed rows are touched instead of wiping and refilling the
+        whole Listbox.
+        """
+        new_state = []
+        for note_id in self._displayed_ids():
+            note = self.notes[note_id]
+            new_state.append((note_id, note.get("title", "Note"), note.get("color", "#FFFF99")))
+
+        old_state = self._listbox_state
+        if len(old_state) == len(new_state) and \
+                all(o[0] == n[0] for o, n in zip(old_state, new_state)):
+            for i, (old_row, new_row) in enumerate(zip(old_state, new_state)):
+                if old_row == new_row:
                     continue
-            
-            self.notes_listbox.insert(tk.END, title)
-            self.notes_listbox.itemconfig(tk.END, {"bg": note.get("color", "#FFFF99")})
+                if old_row[1] != new_row[1]:
+                    self.notes_listbox.delete(i)
+                    self.notes_listbox.insert(i, new_row[1])
+                self.notes_listbox.itemconfig(i, {"bg": new_row[2]})
+        else:
+            self.notes_listbox.delete(0, tk.END)
+            if new_state:
+                # Variadic insert: one Tcl call for all rows
+                self.notes_listbox.insert(tk.END, *[row[1] for row in new_state])
+                for i, row in enumerate(new_state):
+                    self.notes_listbox.itemconfig(i, {"bg": row[2]})
+        self._listbox_state = new_state
+        # Reverse map from listbox row index to note id; selection handlers
+        # index this instead of re-deriving the display list.
+        self._listbox_ids = [row[0] for row in new_state]
 
     def create_new_note(self):
         """Create a new sticky note"""
         note_id = str(int(datetime.now().timestamp() * 1000))
-        print(f"[CREATE_NEW_NOTE] Creating note {note_id} with is_new=True")
+        log.debug("[CREATE_NEW_NOTE] Creating note %s with is_new=True", note_id)
         self.notes[note_id] = {
             "title": "Title",
             "content_text": "",
@@ -263,6 +532,9 @@ class StickyNotesApp:
             "is_new": True,
             "pinned": False
         }
+        bisect.insort(self._sorted_ids, note_id,
+                      key=lambda nid: self.notes[nid].get("created", ""))
+        self._touch(note_id)
         self.save_notes()
         self.refresh_list()
         self.open_note(note_id)
@@ -270,33 +542,19 @@ class StickyNotesApp:
     def on_note_double_click(self, event):
         """Handle double-click on note in list"""
         selection = self.notes_listbox.curselection()
-        if selection:
-            # Get the displayed items after filtering
-            displayed_ids = []
-            for note_id, note in sorted(self.notes.items(), key=lambda x: x[1].get("created", ""), reverse=True):
-                title = note.get("title", "Note")
-                content = note.get("content_text", note.get("content", ""))
-                
-                if self.search_query:
-                    if self.search_query not in title.lower() and self.search_query not in content.lower():
-                        continue
-                
-                displayed_ids.append(note_id)
-            
-            if selection[0] < len(displayed_ids):
-                note_id = displayed_ids[selection[0]]
-                self.open_note(note_id)
+        if selection and selection[0] < len(self._listbox_ids):
+            self.open_note(self._listbox_ids[selection[0]])
 
     def open_note(self, note_id, skip_save=False):
         """Open a note in a new window"""
-        print(f"[OPEN_NOTE] Opening note {note_id} (skip_save={skip_save})")
-        if note_id in self.open_windows and self.open_windows[note_id].winfo_exists():
-            print(f"[OPEN_NOTE] Note already open, lifting window")
+        log.debug("[OPEN_NOTE] Opening note %s (skip_save=%s)", note_id, skip_save)
+        if note_id in self.open_windows:
+            log.debug("[OPEN_NOTE] Note already open, lifting window")
             self.open_windows[note_id].lift()
             return
 
         note = self.notes[note_id]
-        print(f"[OPEN_NOTE] Note data: is_new={note.get('is_new', False)}")
+        log.debug("[OPEN_NOTE] Note data: is_new=%s", note.get('is_new', False))
         window = tk.Toplevel(self.manager)
         if self.icon_ico_path.exists():
             window.iconbitmap(self.icon_ico_path)
@@ -304,15 +562,14 @@ class StickyNotesApp:
         window.configure(bg=note.get("color", "#FFFF99"))
         
         # Check if we should restore position or set default
-        positions = self.load_positions()
-        print(f"[OPEN_NOTE] Positions available: {list(positions.keys())}")
+        positions = self._positions
         if note_id in positions:
             pos = positions[note_id]
-            print(f"[OPEN_NOTE] RESTORING {note_id} to saved position: {pos}")
+            log.debug("[OPEN_NOTE] RESTORING %s to saved position: %s", note_id, pos)
             window.geometry(f"{pos['width']}x{pos['height']}+{pos['x']}+{pos['y']}")
         else:
             # Set default size and center on manager
-            print(f"[OPEN_NOTE] NO saved position for {note_id}, centering")
+            log.debug("[OPEN_NOTE] NO saved position for %s, centering", note_id)
             self.manager.update_idletasks()
             manager_x = self.manager.winfo_x()
             manager_y = self.manager.winfo_y()
@@ -320,13 +577,15 @@ class StickyNotesApp:
             manager_height = self.manager.winfo_height()
             x = manager_x + (manager_width - 200) // 2
             y = manager_y + (manager_height - 200) // 2
-            print(f"[OPEN_NOTE] Centering at: {x}, {y}")
+            log.debug("[OPEN_NOTE] Centering at: %s, %s", x, y)
             window.geometry(f"270x270+{x}+{y}")
         
         # Mark as no longer new after opening
-        print(f"[OPEN_NOTE] Setting is_new=False for {note_id}")
+        log.debug("[OPEN_NOTE] Setting is_new=False for %s", note_id)
         self.notes[note_id]["is_new"] = False
-        self.save_notes()
+        self._dirty_notes.add(note_id)
+        if not skip_save:
+            self.save_notes()
         
         window.update_idletasks()
 
@@ -412,6 +671,7 @@ class StickyNotesApp:
 
         def handle_paste(event):
             try:
+                from PIL import Image, ImageGrab
                 img = ImageGrab.grabclipboard()
                 if isinstance(img, Image.Image):
                     image_id = f"{note_id}_{int(datetime.now().timestamp() * 1000)}.png"
@@ -420,7 +680,9 @@ class StickyNotesApp:
                     
                     image_name = str(image_path)
                     photo = tk.PhotoImage(name=image_name, file=image_path)
-                    
+                    self._image_cache[image_name] = photo
+
+
                     if not hasattr(text_widget, 'images'):
                         text_widget.images = []
                     text_widget.images.append(photo)
@@ -430,24 +692,23 @@ class StickyNotesApp:
                     save_note()
                     return "break"
             except Exception as e:
-                print(f"Paste error: {e}")
+                log.warning("Paste error: %s", e)
             return None
 
         text_widget.bind("<<Paste>>", handle_paste)
 
         # --- Font and Tag Configuration ---
         current_font_size = [10]  # Use list to allow modification in nested function
-        fonts = {}
-        
+
         def get_font_config(size, is_bold=False, is_italic=False, is_underline=False):
             key = (size, is_bold, is_italic, is_underline)
-            if key not in fonts:
+            if key not in self._font_cache:
                 f = font.Font(family="Arial", size=size)
                 if is_bold: f.configure(weight="bold")
                 if is_italic: f.configure(slant="italic")
                 if is_underline: f.configure(underline=True)
-                fonts[key] = f
-            return fonts[key]
+                self._font_cache[key] = f
+            return self._font_cache[key]
 
         def _apply_styles(sel_start, sel_end, is_bold, is_italic, is_underline, size):
             """A centralized function to apply a full set of styles to a selection."""
@@ -484,13 +745,9 @@ class StickyNotesApp:
             # Find the combined style tag and parse it
             for tag in tags_at_start:
                 if tag.startswith("style_"):
-                    parts = tag.split('_')
-                    # style_{size}_{is_bold}_{is_italic}_{is_underline}
-                    if len(parts) == 5:
-                        size = int(parts[1])
-                        is_bold = parts[2] == 'True'
-                        is_italic = parts[3] == 'True'
-                        is_underline = parts[4] == 'True'
+                    parsed = self._parse_style_tag(tag)
+                    if parsed:
+                        size, is_bold, is_italic, is_underline = parsed
                     break
             
             # Apply the requested change
@@ -519,16 +776,18 @@ class StickyNotesApp:
         tk.Button(formatting_frame, text="I", font=("Arial", 10, "italic"), command=lambda: toggle_style("italic"), width=3).pack(side=tk.LEFT)
         tk.Button(formatting_frame, text="U", font=("Arial", 10, "underline"), command=lambda: toggle_style("underline"), width=3).pack(side=tk.LEFT)
 
-        def apply_color_to_widgets(color):
-            window.configure(bg=color)
-            text_widget.configure(bg=color)
-            control_frame.configure(bg=color)
-            title_entry.configure(bg=color)
-            formatting_frame.configure(bg=color)
-            transparency_frame.configure(bg=color)
-            transparency_label_min.configure(bg=color)
-            transparency_slider.configure(bg=color)
-            transparency_label_max.configure(bg=color)
+        # Every widget that takes on the note color, collected once so a
+        # recolor is a single loop instead of nine hand-written calls.
+        color_widgets = [
+            window, text_widget, control_frame, title_entry,
+            formatting_frame, transparency_frame, transparency_label_min,
+            transparency_slider, transparency_label_max,
+        ]
+        # Shared with the manager-side recolor path so bulk color changes
+        # skip the widget-tree traversal too.
+        window._tintable_widgets = color_widgets
+        window._retint = _build_retint(window)
+        apply_color_to_widgets = window._retint
 
         tk.Button(control_frame, text="Color", command=lambda: self._show_color_chooser(window, [note_id], apply_color_to_widgets), bg="#666", fg="white", font=("Arial", 8)).pack(side=tk.LEFT, padx=2)
         tk.Button(control_frame, text="Delete", command=lambda: delete_note(note_id, window), bg="#f44336", fg="white", font=("Arial", 8)).pack(side=tk.LEFT, padx=2)
@@ -538,38 +797,57 @@ class StickyNotesApp:
             text_widget.images = []
 
         if "content_dump" in note:
-            content_dump = note["content_dump"]
-            for key, value, index in content_dump:
+            # Replay the dump with batched Tcl calls: adjacent text entries
+            # are merged into single inserts, and tagon/tagoff pairs are
+            # collected into ranges so each tag is applied with one
+            # variadic tag_add instead of one call per transition.
+            tag_open = {}    # tag -> start index of the currently open range
+            tag_ranges = {}  # tag -> flat [start1, end1, start2, end2, ...]
+            run_start = None
+            run_parts = []
+            for key, value, index in note["content_dump"]:
                 if key == "text":
-                    text_widget.insert(index, value)
-                elif key == "tagon":
+                    if not run_parts:
+                        run_start = index
+                    run_parts.append(value)
+                    continue
+                if run_parts:
+                    text_widget.insert(run_start, ''.join(run_parts))
+                    run_parts = []
+                if key == "tagon":
                     # Ensure tag is configured before applying
                     if value.startswith("style_"):
-                        try:
-                            parts = value.split('_')
-                            if len(parts) == 5:
-                                size = int(parts[1])
-                                is_bold = parts[2] == 'True'
-                                is_italic = parts[3] == 'True'
-                                is_underline = parts[4] == 'True'
-                                font_config = get_font_config(size, is_bold, is_italic, is_underline)
-                                text_widget.tag_configure(value, font=font_config)
-                        except Exception:
-                            pass # Skip malformed tag
-                    text_widget.tag_add(value, index)
+                        parsed = self._parse_style_tag(value)
+                        if parsed:
+                            text_widget.tag_configure(value, font=get_font_config(*parsed))
+                    tag_open.setdefault(value, index)
                 elif key == "tagoff":
-                    text_widget.tag_remove(value, index)
+                    start = tag_open.pop(value, None)
+                    if start is not None:
+                        tag_ranges.setdefault(value, []).extend((start, index))
                 elif key == "image":
                     image_path = Path(value)
-                    if image_path.exists():
+                    photo = self._image_cache.get(value)
+                    if photo is not None:
+                        text_widget.images.append(photo)
+                        text_widget.image_create(index, image=photo)
+                    elif image_path.exists():
                         try:
                             photo = tk.PhotoImage(name=value, file=image_path)
+                            self._image_cache[value] = photo
                             text_widget.images.append(photo)
                             text_widget.image_create(index, image=photo)
                         except Exception as e:
-                            print(f"Failed to load image {image_path}: {e}")
+                            log.warning("Failed to load image %s: %s", image_path, e)
                     else:
                         text_widget.insert(index, f"\n[Image not found: {value}]\n")
+            if run_parts:
+                text_widget.insert(run_start, ''.join(run_parts))
+            for tag, start in tag_open.items():
+                # Tag was still on at the end of the dump
+                tag_ranges.setdefault(tag, []).extend((start, tk.END))
+            for tag, ranges in tag_ranges.items():
+                text_widget.tag_add(tag, *ranges)
         else:
             # Legacy loading for old notes
             text_widget.insert("1.0", note.get("content_text", note.get("content", "")))
@@ -578,34 +856,37 @@ class StickyNotesApp:
                 if len(tag_info) == 3:
                     tag_name, start, end = tag_info
                     if tag_name.startswith("style_"):
-                        try:
-                            parts = tag_name.split('_')
-                            if len(parts) == 5:
-                                size = int(parts[1])
-                                is_bold = parts[2] == 'True'
-                                is_italic = parts[3] == 'True'
-                                is_underline = parts[4] == 'True'
-                                font_config = get_font_config(size, is_bold, is_italic, is_underline)
-                                text_widget.tag_configure(tag_name, font=font_config)
-                        except Exception: continue
+                        parsed = self._parse_style_tag(tag_name)
+                        if parsed:
+                            text_widget.tag_configure(tag_name, font=get_font_config(*parsed))
                     text_widget.tag_add(tag_name, start, end)
 
+        def sync_content_dump():
+            # Full-buffer dump serializing tags, images and marks; too
+            # expensive for the keystroke path, so it runs at flush time.
+            # Only content-bearing entries are kept; marks, embedded
+            # windows and the transient "sel" tag are noise on disk.
+            self.notes[note_id]["content_dump"] = [
+                entry for entry in text_widget.dump("1.0", tk.END, all=True)
+                if entry[0] in _DUMP_KEYS
+                and (entry[1] != "sel" or entry[0] == "text")
+            ]
+
         # Save on any modification
         def save_note(*args):
             self.notes[note_id]["title"] = title_var.get()
-            
-            # Use dump to serialize content including images and formatting
-            self.notes[note_id]["content_dump"] = text_widget.dump("1.0", tk.END, all=True)
-            
+
             # Keep a plain text version for search
             self.notes[note_id]["content_text"] = text_widget.get("1.0", tk.END).strip()
 
             # Remove legacy fields
             self.notes[note_id].pop("content_tags", None)
             self.notes[note_id].pop("content", None) # Handle legacy notes
+            self._touch(note_id)
+            self._pending_dumps[note_id] = sync_content_dump
 
             window.title(title_var.get())
-            self.save_notes()
+            self._schedule_save()
             self.refresh_list()
 
         text_widget.bind("<KeyRelease>", save_note)
@@ -616,106 +897,125 @@ class StickyNotesApp:
 
         def delete_note(nid, win):
             if messagebox.askyesno("Delete", "Delete this note?"):
+                self._forget_note(nid)
                 del self.notes[nid]
                 self.save_notes()
                 self.refresh_list()
                 win.destroy()
-                if nid in self.open_windows:
-                    del self.open_windows[nid]
 
         def on_close():
             # If note is deleted, don't save, just clean up
             if note_id in self.notes:
                 save_note() # Save content and tags
 
-                # Save the position of the window being closed
-                positions = self.load_positions()
-                positions[note_id] = {
+                # Remember the position of the window being closed; the
+                # in-memory dict is flushed to disk by save_positions.
+                self._positions[note_id] = {
                     "x": window.winfo_x(),
                     "y": window.winfo_y(),
                     "width": window.winfo_width(),
                     "height": window.winfo_height()
                 }
-                with open(self.positions_file, 'w') as f:
-                    json.dump(positions, f, indent=2)
 
             if note_id in self.open_windows:
                 del self.open_windows[note_id]
+            self._live_window_ids.discard(note_id)
+            self._flush_notes()
             self.save_state()
             window.destroy()
 
+        window.bind("<FocusOut>", lambda e: self._flush_notes())
+
+        def on_destroy(event, nid=note_id):
+            # Fires for every child widget too; only act on the toplevel.
+            if event.widget is window:
+                self.open_windows.pop(nid, None)
+                self._live_window_ids.discard(nid)
+
+        # Keep the liveness bookkeeping correct however the window dies
+        # (WM close, destroy() from bulk close/delete, interpreter teardown)
+        # so callers never need a winfo_exists round-trip.
+        window.bind("<Destroy>", on_destroy)
         window.protocol("WM_DELETE_WINDOW", on_close)
         self.open_windows[note_id] = window
-        print(f"[OPEN_NOTE] Window added to open_windows, total now: {len(self.open_windows)}")
+        self._live_window_ids.add(note_id)
+        log.debug("[OPEN_NOTE] Window added to open_windows, total now: %d", len(self.open_windows))
         # Only save state, never save positions during note opening
-        self.save_state()
-        print(f"[OPEN_NOTE] Saved state only (skip_save={skip_save})")
+        if not skip_save:
+            self.save_state()
+        log.debug("[OPEN_NOTE] Saved state only (skip_save=%s)", skip_save)
 
     def restore_open_notes(self):
         """Restore previously open notes"""
         state = self.load_state()
-        for note_id in state["open_notes"]:
-            if note_id in self.notes:
-                self.open_note(note_id)
+        to_restore = [nid for nid in state["open_notes"] if nid in self.notes]
+        if not to_restore:
+            return
+        # Defer window construction until the manager has painted, and
+        # batch the per-open notes/state writes into one pass at the end.
+        for note_id in to_restore:
+            self.manager.after_idle(lambda nid=note_id: self.open_note(nid, skip_save=True))
+        self.manager.after_idle(self._finish_restore)
+
+    def _finish_restore(self):
+        self.save_notes()
+        self.save_state()
 
     def delete_selected_note(self, event):
         """Delete selected note from list"""
         self.delete_selected_note_btn()
 
-    def delete_selected_note_btn(self):
-        """Delete button handler"""
-        selection = self.notes_listbox.curselection()
-        if not selection:
-            messagebox.showwarning("Select Note", "Please select one or more notes to delete")
-            return
-
-        # Get the displayed items after filtering
-        displayed_ids = []
-        for note_id, note in sorted(self.notes.items(), key=lambda x: x[1].get("created", ""), reverse=True):
-            title = note.get("title", "Note")
-            content = note.get("content_text", note.get("content", ""))
-            
-            if self.search_query:
-                if self.search_query not in title.lower() and self.search_query not in content.lower():
-                    continue
-            
-            displayed_ids.append(note_id)
-        
-        note_ids_to_delete = [displayed_ids[i] for i in selection if i < len(displayed_ids)]
-
-        if not note_ids_to_delete:
+    def _delete_by_ids(self, note_ids):
+        """Confirm and delete the given notes, closing any open windows."""
+        if not note_ids:
             return
-
-        if messagebox.askyesno("Delete", f"Delete {len(note_ids_to_delete)} selected notes?"):
-            for note_id in note_ids_to_delete:
+        if messagebox.askyesno("Delete", f"Delete {len(note_ids)} selected notes?"):
+            for note_id in note_ids:
                 if note_id in self.notes:
+                    self._forget_note(note_id)
                     del self.notes[note_id]
-                if note_id in self.open_windows and self.open_windows[note_id].winfo_exists():
+                if note_id in self._live_window_ids:
+                    # The <Destroy> binding removes the bookkeeping entries
                     self.open_windows[note_id].destroy()
             self.save_notes()
             self.refresh_list()
 
+    def _close_by_ids(self, note_ids):
+        """Close any open windows for the given notes."""
+        for note_id in note_ids:
+            if note_id in self._live_window_ids:
+                # The <Destroy> binding removes the bookkeeping entries
+                self.open_windows[note_id].destroy()
+
+    def _selected_note_ids(self):
+        """Note ids for the rows currently selected in the listbox."""
+        ids = self._listbox_ids
+        return [ids[i] for i in self.notes_listbox.curselection() if i < len(ids)]
+
+    def delete_selected_note_btn(self):
+        """Delete button handler"""
+        selected_note_ids = self._selected_note_ids()
+        if not selected_note_ids:
+            messagebox.showwarning("Select Note", "Please select one or more notes to delete")
+            return
+        self._delete_by_ids(selected_note_ids)
+
     def close_selected_notes(self):
         """Close selected notes from the listbox."""
-        selection = self.notes_listbox.curselection()
-        if not selection:
-            return
+        self._close_by_ids(self._selected_note_ids())
 
-        displayed_ids = []
-        for note_id, note in sorted(self.notes.items(), key=lambda x: x[1].get("created", ""), reverse=True):
-            title = note.get("title", "Note")
-            content = note.get("content_text", note.get("content", ""))
-            if self.search_query:
-                if self.search_query not in title.lower() and self.search_query not in content.lower():
-                    continue
-            displayed_ids.append(note_id)
-        
-        selected_note_ids = [displayed_ids[i] for i in selection if i < len(displayed_ids)]
+    def _rightclick_select(self, index):
+        """Retarget the listbox selection to one row in a single Tcl eval.
 
-        for note_id in selected_note_ids:
-            if note_id in self.open_windows and self.open_windows[note_id].winfo_exists():
-                # The on_close protocol will handle saving and cleanup
-                self.open_windows[note_id].destroy()
+        Clears the old selection, selects the given row and returns the
+        new selection without three separate interpreter round-trips.
+        """
+        lb = self.notes_listbox
+        result = lb.tk.eval(
+            f"{lb} selection clear 0 end; "
+            f"{lb} selection set {index}; "
+            f"{lb} curselection")
+        return tuple(int(i) for i in result.split())
 
     def on_right_click(self, event):
         """Handle right-click on note"""
@@ -724,26 +1024,13 @@ class StickyNotesApp:
 
         # if right-clicking on an item not in the selection, change selection to that item
         if clicked_index not in selection:
-            self.notes_listbox.selection_clear(0, tk.END)
-            self.notes_listbox.selection_set(clicked_index)
-            selection = (clicked_index,)
+            selection = self._rightclick_select(clicked_index)
 
         if not selection:
             return
 
-        # Get the displayed items after filtering
-        displayed_ids = []
-        for note_id, note in sorted(self.notes.items(), key=lambda x: x[1].get("created", ""), reverse=True):
-            title = note.get("title", "Note")
-            content = note.get("content_text", note.get("content", ""))
-            
-            if self.search_query:
-                if self.search_query not in title.lower() and self.search_query not in content.lower():
-                    continue
-            
-            displayed_ids.append(note_id)
-        
-        selected_note_ids = [displayed_ids[i] for i in selection if i < len(displayed_ids)]
+        # The listbox rows map straight back to note ids
+        selected_note_ids = self._selected_note_ids()
 
         if not selected_note_ids:
             return
@@ -752,43 +1039,33 @@ class StickyNotesApp:
         delete_label = f"Delete {len(selected_note_ids)} Notes" if len(selected_note_ids) > 1 else "Delete Note"
         color_label = f"Change Color for {len(selected_note_ids)} Notes" if len(selected_note_ids) > 1 else "Change Color"
         
-        open_notes_in_selection = [nid for nid in selected_note_ids if nid in self.open_windows and self.open_windows[nid].winfo_exists()]
+        open_notes_in_selection = [nid for nid in selected_note_ids if nid in self._live_window_ids]
         if open_notes_in_selection:
             close_label = f"Close {len(open_notes_in_selection)} Notes" if len(open_notes_in_selection) > 1 else "Close Note"
-            menu.add_command(label=close_label, command=self.close_selected_notes)
+            menu.add_command(label=close_label,
+                             command=lambda ids=open_notes_in_selection: self._close_by_ids(ids))
             menu.add_separator()
 
-        menu.add_command(label=delete_label, command=self.delete_selected_note_btn)
+        menu.add_command(label=delete_label,
+                         command=lambda ids=selected_note_ids: self._delete_by_ids(ids))
         menu.add_command(label=color_label, command=lambda: self._show_color_chooser(self.manager, selected_note_ids))
         menu.post(event.x_root, event.y_root)
 
     def on_manager_close(self):
         """Handle manager window close"""
+        self._flush_notes()
         self.save_state()
         self.save_positions()
+        self._drain_io()
         self.manager.destroy()
 
-    def _show_color_chooser(self, parent, note_ids, on_color_selected_callback=None):
-        """Shows a color chooser dialog."""
-        colors = {
-            "Yellow": "#FFFF99", "Blue": "#99CCFF", "Green": "#99FF99",
-            "Pink": "#FFB6C1", "Orange": "#FFCC99", "Purple": "#CC99FF",
-            "Red": "#FF9999", "Cyan": "#99FFFF", "Lime": "#CCFF99",
-            "Salmon": "#FFA07A", "Lavender": "#E6CCFF", "Peach": "#FFCCB3",
-            "Mint": "#B3FFCC", "Sky": "#B3DDFF", "Gold": "#FFE699",
-            "Rose": "#FFB3D9", "Teal": "#99CCCC", "Plum": "#DD99FF",
-            "Coral": "#FF9999", "Khaki": "#FFFF99", "Apricot": "#FFCC99",
-            "Powder Blue": "#B0E0E6", "Honeydew": "#F0FFF0", "Thistle": "#D8BFD8",
-            "Wheat": "#F5DEB3", "Beige": "#F5F5DC", "Cornsilk": "#FFF8DC",
-            "Linen": "#FAF0E6", "Misty Rose": "#FFE4E1", "Floral White": "#FFFAF0",
-            "Seashell": "#FFF5EE", "Antique White": "#FAEBD7", "Cream": "#FFFDD0",
-            "Light Yellow": "#FFFFE0", "Light Green": "#90EE90", "Light Blue": "#ADD8E6",
-            "Light Pink": "#FFB6C1", "Light Gray": "#D3D3D3", "Dark Salmon": "#E9967A",
-            "Light Salmon": "#FFA07A", "Light Sea Green": "#20B2AA"
-        }
-        color_window = tk.Toplevel(parent)
+    def _build_color_chooser(self):
+        """Build the color chooser window; done once, then reused."""
+        color_window = tk.Toplevel(self.manager)
         color_window.title("Choose Color")
         color_window.geometry("200x250")
+        color_window.withdraw()
+        color_window.protocol("WM_DELETE_WINDOW", color_window.withdraw)
 
         frame = tk.Frame(color_window)
         frame.pack(fill=tk.BOTH, expand=True)
@@ -800,46 +1077,73 @@ class StickyNotesApp:
         button_frame = tk.Frame(canvas)
         canvas.create_window((0, 0), window=button_frame, anchor="nw")
 
-
-        def apply_color(color):
-            note_id_list = note_ids if isinstance(note_ids, list) else [note_ids]
-            for note_id in note_id_list:
-                self.notes[note_id]["color"] = color
-                
-                # If a single callback is provided, it's for a single open note window
-                if on_color_selected_callback and len(note_id_list) == 1:
-                    on_color_selected_callback(color)
-                
-                # If the note window is open, update its colors too
-                if note_id in self.open_windows:
-                    open_window = self.open_windows[note_id]
-                    # Only update specific widgets, not all buttons
-                    for widget in open_window.winfo_children():
-                        if isinstance(widget, tk.Frame):
-                            widget.configure(bg=color)
-                            for sub_widget in widget.winfo_children():
-                                # Skip Color, Delete, and formatting buttons
-                                if isinstance(sub_widget, tk.Button):
-                                    button_text = sub_widget.cget("text")
-                                    if button_text not in ["Color", "Delete", "B", "I", "U", "Pin", "Unpin"] and not button_text.startswith("A"):
-                                        sub_widget.configure(bg=color)
-                                elif isinstance(sub_widget, (tk.Entry, tk.Label, tk.Scale)):
-                                    sub_widget.configure(bg=color)
-                        elif isinstance(widget, tk.Text):
-                            widget.configure(bg=color)
-                    open_window.configure(bg=color)
-
-            self.save_notes()
-            self.refresh_list()
-            color_window.destroy()
-
-        for name, code in colors.items():
-            btn = tk.Button(button_frame, text=name, bg=code, command=lambda c=code: apply_color(c), width=20)
+        for name, code in _COLOR_PALETTE:
+            btn = tk.Button(button_frame, text=name, bg=code, width=20,
+                            command=lambda c=code: self._apply_chooser_color(c))
             btn.pack(fill=tk.X, padx=5, pady=2)
-        
-        button_frame.update_idletasks()
-        canvas.config(scrollregion=canvas.bbox("all"))
+            self._color_buttons.append((code, btn))
+
+        # Every row is one fixed-height button plus 2px of padding either
+        # side, so the scrollregion is known without update_idletasks()
+        # forcing a synchronous geometry pass.
+        row_height = btn.winfo_reqheight() + 4
+        canvas.config(scrollregion=(0, 0, 180, len(_COLOR_PALETTE) * row_height))
+        self._color_chooser = color_window
+
+    def _apply_chooser_color(self, color):
+        """Apply a palette pick to the notes targeted by the last
+        _show_color_chooser call."""
+        note_id_list, on_color_selected_callback = self._color_target
+        # Locals for the bulk loop: large selections hit these per note
+        notes = self.notes
+        open_windows = self.open_windows
+        dirty = self._dirty_notes
+        changed = [nid for nid in note_id_list
+                   if notes[nid].get("color") != color]
+        if not changed:
+            # Picking the color the notes already have: nothing to write
+            # or redraw
+            self._color_chooser.withdraw()
+            return
+        for note_id in changed:
+            notes[note_id]["color"] = color
+            dirty.add(note_id)
+
+            # If a single callback is provided, it's for a single open note window
+            if on_color_selected_callback and len(note_id_list) == 1:
+                on_color_selected_callback(color)
+
+            # If the note window is open, update its colors too
+            window = open_windows.get(note_id)
+            if window is not None:
+                window._retint(color)
+
+        self._schedule_refresh()
+        self._color_chooser.withdraw()
+
+    def _schedule_refresh(self):
+        """Coalesce save+refresh so rapid palette clicks redraw once."""
+        if not self._pending_refresh:
+            self._pending_refresh = True
+            self.manager.after_idle(self._flush_refresh)
+
+    def _flush_refresh(self):
+        self._pending_refresh = False
+        self.save_notes()
+        self.refresh_list()
+
+    def _show_color_chooser(self, parent, note_ids, on_color_selected_callback=None):
+        """Shows a color chooser dialog."""
+        if self._color_chooser is None:
+            self._build_color_chooser()
+        # The palette buttons carry stable commands that read the current
+        # target, so re-opening the chooser costs zero Tcl configures.
+        # note_ids is always a list of ids at both call sites.
+        self._color_target = (note_ids, on_color_selected_callback)
+        self._color_chooser.deiconify()
+        self._color_chooser.lift()
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
     app = StickyNotesApp()
     app.manager.mainloop()
\ No newline at end of file